@@ -1,17 +1,62 @@
 import logging
 import openpyxl
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Tuple
+from typing import (
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    Tuple,
+)
 import re
+import sys
 import csv
+import tempfile
+import xml.sax
+import xml.sax.handler
+import zipfile
 import requests
-from datetime import datetime
-from collections import defaultdict
-import pyexcel_ods
-from io import BytesIO, StringIO
+from datetime import date, datetime, time, timedelta
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from operator import itemgetter
+from io import BytesIO, TextIOWrapper
 from openpyxl.utils.cell import get_column_letter, column_index_from_string
 from packaging.version import Version
 
+# Regex fragments accepting (at least) what each strptime directive accepts
+_STRPTIME_DIRECTIVE_PATTERNS = {
+    "Y": r"\d{4}",
+    "y": r"\d{2}",
+    "m": r"\d{1,2}",
+    "d": r" ?\d{1,2}",
+    "H": r"\d{1,2}",
+    "I": r" ?\d{1,2}",
+    "M": r"\d{1,2}",
+    "S": r"\d{1,2}",
+    "f": r"\d{1,6}",
+    "j": r"\d{1,3}",
+    # Locale names may contain dots or spaces (e.g. "févr."); ending on a non-space
+    # keeps the fragment from competing with the whitespace run that follows it
+    "b": r"\D*?[^\d\s]",
+    "B": r"\D*?[^\d\s]",
+    "a": r"\D*?[^\d\s]",
+    "A": r"\D*?[^\d\s]",
+    "p": r"\D*?[^\d\s]",
+    "%": "%",
+}
+
+# Column letters and row number of a cell reference such as "B12" or "$B$12"
+_CELL_REF_PATTERN = re.compile(r"\$?([A-Za-z]+)\$?(\d*)")
+
+# Column letters indexed by column number, up to Excel's maximum of 16384 ("XFD")
+_COLUMN_LETTERS = ("",) + tuple(get_column_letter(i) for i in range(1, 16385))
+
 
 # Define a custom exception for file parsing errors
 class SpreadsheetParsingError(Exception):
@@ -20,6 +65,197 @@ class SpreadsheetParsingError(Exception):
     pass
 
 
+# OpenDocument XML namespaces used when reading ODS content.xml
+_ODS_OFFICE_NS = "urn:oasis:names:tc:opendocument:xmlns:office:1.0"
+_ODS_TABLE_NS = "urn:oasis:names:tc:opendocument:xmlns:table:1.0"
+_ODS_TEXT_NS = "urn:oasis:names:tc:opendocument:xmlns:text:1.0"
+_ODS_READ_CHUNK_SIZE = 64 * 1024  # Bytes of content.xml fed to the parser at a time
+
+
+class _OdsContentHandler(xml.sax.handler.ContentHandler):
+    """
+    SAX handler that turns ODS content.xml into (sheet name, row values) records.
+
+    Completed rows are appended to ``self.rows`` as they are parsed; fully empty rows
+    are only emitted once a later non-empty row needs them to keep row numbers right,
+    so trailing runs of repeated empty rows and cells are never expanded.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.rows: List[Tuple[str, Sequence]] = []
+        self._sheet_name = ""
+        self._pending_empty_rows = 0
+        self._row: List = []
+        self._row_repeat = 1
+        self._pending_empty_cells = 0
+        self._cell_value = None
+        self._cell_repeat = 1
+        self._in_cell = False
+        self._paragraphs: List[str] = []
+        self._text: Optional[List[str]] = None
+        self._annotation_depth = 0
+
+    def startElementNS(self, name, qname, attrs):
+        uri, tag = name
+        if uri == _ODS_TABLE_NS:
+            if tag == "table":
+                self._sheet_name = sys.intern(attrs.get((_ODS_TABLE_NS, "name"), ""))
+                self._pending_empty_rows = 0
+            elif tag == "table-row":
+                self._row = []
+                self._row_repeat = int(
+                    attrs.get((_ODS_TABLE_NS, "number-rows-repeated"), 1)
+                )
+                self._pending_empty_cells = 0
+            elif tag in ("table-cell", "covered-table-cell"):
+                self._in_cell = True
+                self._cell_repeat = int(
+                    attrs.get((_ODS_TABLE_NS, "number-columns-repeated"), 1)
+                )
+                self._cell_value = self._read_cell_value(attrs)
+                self._paragraphs = []
+        elif uri == _ODS_OFFICE_NS and tag == "annotation":
+            self._annotation_depth += 1
+        elif uri == _ODS_TEXT_NS and self._in_cell and not self._annotation_depth:
+            if tag == "p":
+                self._text = []
+            elif self._text is not None:
+                if tag == "s":
+                    self._text.append(" " * int(attrs.get((_ODS_TEXT_NS, "c"), 1)))
+                elif tag == "tab":
+                    self._text.append("\t")
+                elif tag == "line-break":
+                    self._text.append("\n")
+
+    def endElementNS(self, name, qname):
+        uri, tag = name
+        if uri == _ODS_TABLE_NS:
+            if tag in ("table-cell", "covered-table-cell"):
+                self._end_cell()
+            elif tag == "table-row":
+                self._end_row()
+        elif uri == _ODS_OFFICE_NS and tag == "annotation":
+            self._annotation_depth -= 1
+        elif uri == _ODS_TEXT_NS and tag == "p" and self._text is not None:
+            self._paragraphs.append("".join(self._text))
+            self._text = None
+
+    def characters(self, content):
+        if self._text is not None:
+            self._text.append(content)
+
+    def _end_cell(self):
+        value = self._cell_value
+        if value is None and self._paragraphs:
+            value = "\n".join(self._paragraphs)
+        if value is None or value == "":
+            self._pending_empty_cells += self._cell_repeat
+        else:
+            if self._pending_empty_cells:
+                self._row.extend([None] * self._pending_empty_cells)
+                self._pending_empty_cells = 0
+            self._row.extend([value] * self._cell_repeat)
+        self._in_cell = False
+
+    def _end_row(self):
+        if not self._row:
+            self._pending_empty_rows += self._row_repeat
+            return
+        for _ in range(self._pending_empty_rows):
+            self.rows.append((self._sheet_name, ()))
+        self._pending_empty_rows = 0
+        for _ in range(self._row_repeat):
+            self.rows.append((self._sheet_name, self._row))
+
+    @staticmethod
+    def _read_cell_value(attrs):
+        """Read a typed cell value from its attributes; None means use the cell's text."""
+        value_type = attrs.get((_ODS_OFFICE_NS, "value-type"))
+        if value_type in ("float", "percentage"):
+            value = attrs.get((_ODS_OFFICE_NS, "value"))
+            if value is None:
+                return None
+            number = float(value)
+            if value_type == "float" and number.is_integer():
+                return int(number)
+            return number
+        if value_type == "currency":
+            value = attrs.get((_ODS_OFFICE_NS, "value"))
+            currency = attrs.get((_ODS_OFFICE_NS, "currency"))
+            if value is not None and currency:
+                return f"{value} {currency}"
+            return value
+        if value_type == "date":
+            value = attrs.get((_ODS_OFFICE_NS, "date-value"))
+            try:
+                if value is not None and len(value) == 10:
+                    return date.fromisoformat(value)
+                return datetime.fromisoformat(value[:26]) if value else None
+            except ValueError:
+                return value
+        if value_type == "time":
+            value = attrs.get((_ODS_OFFICE_NS, "time-value"))
+            match = re.fullmatch(r"PT(\d+)H(\d+)M(\d+)(?:\.\d+)?S", value or "")
+            if match is None:
+                return value
+            hours, minutes, seconds = map(int, match.groups())
+            if hours < 24:
+                return time(hours, minutes, seconds)
+            return timedelta(hours=hours, minutes=minutes, seconds=seconds)
+        if value_type == "boolean":
+            value = attrs.get((_ODS_OFFICE_NS, "boolean-value"))
+            return {"true": True, "false": False}.get(value, value)
+        return None
+
+
+def _iter_ods_rows(file: BinaryIO) -> Iterator[Tuple[str, Sequence]]:
+    """
+    Stream (sheet name, row values) records out of an ODS file.
+
+    Row values are positional, with None for empty cells; rows of one sheet are
+    consecutive and numbered by their position in the stream.
+    """
+    handler = _OdsContentHandler()
+    parser = xml.sax.make_parser()
+    parser.setFeature(xml.sax.handler.feature_namespaces, True)
+    parser.setContentHandler(handler)
+    with zipfile.ZipFile(file) as archive, archive.open("content.xml") as content:
+        while True:
+            chunk = content.read(_ODS_READ_CHUNK_SIZE)
+            if chunk:
+                parser.feed(chunk)
+            else:
+                parser.close()
+            yield from handler.rows
+            handler.rows.clear()
+            if not chunk:
+                return
+
+
+# Workbook data and compressor of a parse_excel worker process, set by _init_excel_worker
+_excel_worker_state: Dict[str, object] = {}
+
+
+def _init_excel_worker(
+    compressor_class: type, compressor_options: Dict[str, object], data: bytes
+) -> None:
+    """
+    Set up a parse_excel worker process.
+
+    The workbook data and a fresh compressor are built once per process, so tasks
+    only carry a sheet name and the compressor's caches never cross processes.
+    """
+    _excel_worker_state["compressor"] = compressor_class(**compressor_options)
+    _excel_worker_state["data"] = data
+
+
+def _parse_excel_sheet_in_worker(sheet_name: str) -> Dict[str, List[Tuple[str, str]]]:
+    """Process one sheet of the workbook given to _init_excel_worker."""
+    compressor = _excel_worker_state["compressor"]
+    return compressor._parse_excel_sheet(_excel_worker_state["data"], sheet_name)
+
+
 class SpreadsheetCompressor:
     """
     A class to parse and compress spreadsheet data for LLM consumption.
@@ -29,6 +265,10 @@ class SpreadsheetCompressor:
     """
 
     SUPPORTED_EXTENSIONS = (".xlsx", ".xlsm", ".xltx", ".xltm", ".ods", ".csv")
+    TYPE_CACHE_MAX_SIZE = 100_000  # Entries kept before the type cache is reset
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # Bytes written to disk per downloaded chunk
+    PARSE_CACHE_MAX_SIZE = 32  # Parsed files kept for conditional re-download
+    MAX_CLASSIFIED_LENGTH = 2048  # Longer values are "Others" without any matching
 
     def __init__(
         self,
@@ -57,18 +297,79 @@ class SpreadsheetCompressor:
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
 
-        # Compile default regex patterns
+        # Default regex patterns, each matched against the whole value; they are
+        # written so no two quantified parts can match the same characters, which
+        # keeps failed matches from backtracking quadratically on long values
         default_patterns = {
-            "url": r"^(https?:\/\/|www\.|ftp:\/\/|file:\/\/)[a-zA-Z0-9\-\.]+\.[a-zA-Z]{2,}(:[0-9]+)?(\/\S*)?$",
-            "year": r"^(1|2)\d{3}$",
-            "integer": r"^-?\d+$",
-            "percentage": r"^-?\d+\.?\d*%$",
-            "scientific": r"^-?\d+\.?\d*[eE][+-]?\d+$",
-            "float": r"^-?\d*\.\d+$",
-            "currency": r"^[$€£¥]\s*-?\d+\.?\d*$|^-?\d+\.?\d*\s*[$€£¥]$",
-            "email": r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$",
+            "url": r"(?:https?://|www\.|ftp://|file://)(?:[a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}(?::[0-9]+)?(?:/\S*)?",
+            "year": r"[12]\d{3}",
+            "integer": r"-?\d+",
+            "percentage": r"-?\d+(?:\.\d*)?%",
+            "scientific": r"-?\d+(?:\.\d*)?[eE][+-]?\d+",
+            "float": r"-?\d*\.\d+",
+            "currency": r"[$€£¥]\s*-?\d+(?:\.\d*)?|-?\d+(?:\.\d*)?\s*[$€£¥]",
+            "email": r"[a-zA-Z0-9._%+-]+@(?:[a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}",
+        }
+        custom_patterns = custom_patterns or {}
+        # Constructor arguments, used to build equivalent compressors in worker processes
+        self._init_options = {
+            "log_level": log_level,
+            "custom_patterns": custom_patterns,
+            "custom_date_patterns": custom_date_patterns,
+            "custom_time_patterns": custom_time_patterns,
         }
-        self._patterns = {**default_patterns, **(custom_patterns or {})}
+        patterns = {**default_patterns, **custom_patterns}
+        # Only the defaults ahead of the first overridden name can be fused without
+        # changing which pattern matches first
+        fused_patterns = {}
+        for name in patterns:
+            if name in custom_patterns:
+                break
+            fused_patterns[name] = default_patterns[name]
+        # Fuse those default patterns into a single alternation of named groups so one
+        # fullmatch classifies a value; the matching group name maps to its label
+        self._combined_pattern = self._fuse_patterns(fused_patterns)
+        # Narrower fused patterns, chosen by the first character of a value, so most
+        # values are only tested against the defaults that could possibly match them
+        numeric_names = ("year", "integer", "percentage", "scientific", "float")
+        self._numeric_pattern = self._fuse_patterns(
+            {
+                name: pattern
+                for name, pattern in fused_patterns.items()
+                if name in (*numeric_names, "currency", "email")
+            }
+        )
+        self._alpha_pattern = self._fuse_patterns(
+            {
+                name: pattern
+                for name, pattern in fused_patterns.items()
+                if name in ("url", "email")
+            }
+        )
+        self._currency_pattern = self._fuse_patterns(
+            {
+                name: pattern
+                for name, pattern in fused_patterns.items()
+                if name == "currency"
+            }
+        )
+        # int/float values can skip the regex pass unless a custom pattern comes first
+        self._numeric_fast_path = {"year", "integer", "float"} <= fused_patterns.keys()
+        self._combined_labels = {name: f"[{name.upper()}]" for name in fused_patterns}
+        # The remaining patterns are tried one by one in their original order; custom
+        # patterns may use their own groups and, as before, only match at the start
+        self._patterns = [
+            (
+                f"[{name.upper()}]",
+                (
+                    re.compile(pattern).match
+                    if name in custom_patterns
+                    else re.compile(pattern).fullmatch
+                ),
+            )
+            for name, pattern in patterns.items()
+            if name not in fused_patterns
+        ]
 
         # Define default date and time patterns
         self._date_patterns = custom_date_patterns or [
@@ -92,11 +393,23 @@ class SpreadsheetCompressor:
             "%I:%M:%S %p",
         ]
 
+        # Cheap regex pre-checks so strptime only runs on values shaped like a date/time
+        self._date_regex = self._strptime_formats_to_regex(self._date_patterns)
+        self._time_regex = self._strptime_formats_to_regex(self._time_patterns)
+
+        # Cache of stripped cell value -> recognized data type
+        self._type_cache: Dict[str, str] = {}
+
+        # Cache of (URL, parser arguments) -> (HTTP validators, parse result), in LRU order
+        self._parse_cache: OrderedDict = OrderedDict()
+
         self._excel_min_version = Version(
             "1.4.0"
         )  # Minimum version for openpyxl features
 
-    def recognize_data_type(self, value: Optional[Union[str, int, float]]) -> str:
+    def recognize_data_type(
+        self, value: Optional[Union[str, int, float, date, time]]
+    ) -> str:
         """
         Recognize the data type of a cell value.
 
@@ -106,41 +419,153 @@ class SpreadsheetCompressor:
         Returns:
             str: The recognized data type (e.g., "[INTEGER]", "[DATE]", "Others").
         """
-        if value is None or (isinstance(value, str) and not value.strip()):
+        if value is None:
             return "Empty"
 
-        value_str = str(value).strip()
-
-        # Check against compiled patterns
-        for pattern_name, pattern in self._patterns.items():
-            if re.match(pattern, value_str):
-                return f"[{pattern_name.upper()}]"
+        if isinstance(value, str):
+            # strip() hands back the same object when there is nothing to remove
+            value_str = value.strip()
+            if not value_str:
+                return "Empty"
+        else:
+            # Native cell values (e.g. from openpyxl) need no string conversion
+            if self._numeric_fast_path and not isinstance(value, bool):
+                if isinstance(value, int):
+                    return "[YEAR]" if 1000 <= value <= 2999 else "[INTEGER]"
+                # str() only switches to exponent notation outside this range
+                if isinstance(value, float) and (
+                    value == 0 or 1e-4 <= abs(value) < 1e16
+                ):
+                    return "[FLOAT]"
+            if isinstance(value, date):
+                return "[DATE]"
+            if isinstance(value, time):
+                return "[TIME]"
+            value_str = str(value)
+            if not value_str:
+                return "Empty"
+
+        if len(value_str) > self.MAX_CLASSIFIED_LENGTH:
+            return "Others"
+
+        cached = self._type_cache.get(value_str)
+        if cached is not None:
+            return cached
+
+        result = self._classify_value(value_str)
+        if len(self._type_cache) >= self.TYPE_CACHE_MAX_SIZE:
+            self._type_cache.clear()
+        self._type_cache[value_str] = result
+        return result
+
+    def _classify_value(self, value_str: str) -> str:
+        """Helper function to classify a stripped, non-empty cell value."""
+        # Check against the fused default patterns, then the remaining patterns
+        first_char = value_str[0]
+        if first_char.isdigit() or first_char in "-.":
+            match = self._numeric_pattern.fullmatch(value_str)
+        elif first_char.isalpha():
+            match = self._alpha_pattern.fullmatch(value_str)
+        elif first_char in "$€£¥":
+            match = self._currency_pattern.fullmatch(value_str)
+        else:
+            match = self._combined_pattern.fullmatch(value_str)
+        if match:
+            return self._combined_labels[match.lastgroup]
+        for label, matcher in self._patterns:
+            if matcher(value_str):
+                return label
 
         # Check date patterns
-        for pattern in self._date_patterns:
-            try:
-                datetime.strptime(value_str, pattern)
-                return "[DATE]"
-            except ValueError:
-                continue
+        if self._date_regex.fullmatch(value_str):
+            for pattern in self._date_patterns:
+                try:
+                    datetime.strptime(value_str, pattern)
+                    return "[DATE]"
+                except ValueError:
+                    continue
 
         # Check time patterns
-        for pattern in self._time_patterns:
-            try:
-                datetime.strptime(value_str, pattern)
-                return "[TIME]"
-            except ValueError:
-                continue
+        if self._time_regex.fullmatch(value_str):
+            for pattern in self._time_patterns:
+                try:
+                    datetime.strptime(value_str, pattern)
+                    return "[TIME]"
+                except ValueError:
+                    continue
 
         return "Others"
 
+    @staticmethod
+    def _fuse_patterns(patterns: Dict[str, str]) -> re.Pattern:
+        """Helper function to join full-match patterns into one alternation of named groups."""
+        if not patterns:
+            return re.compile(r"(?!)")  # Never matches
+        return re.compile(
+            "|".join(f"(?P<{name}>{pattern})" for name, pattern in patterns.items())
+        )
+
+    @staticmethod
+    def _strptime_formats_to_regex(formats: List[str]) -> re.Pattern:
+        """
+        Build a regex matching every string that any of the strptime formats could parse.
+
+        The regex is deliberately looser than strptime (e.g. it does not range-check
+        numbers), so a match still has to be validated with strptime. Formats using a
+        directive without a known regex fragment make the regex match anything.
+        """
+        alternatives = []
+        for fmt in formats:
+            parts = []
+            for token in re.findall(r"%.|\s+|[^%\s]+|%", fmt):
+                if token.startswith("%") and len(token) == 2:
+                    fragment = _STRPTIME_DIRECTIVE_PATTERNS.get(token[1])
+                    if fragment is None:
+                        return re.compile(r".*", re.DOTALL)
+                    parts.append(fragment)
+                elif token.isspace():
+                    parts.append(r"\s+")  # strptime treats any whitespace run alike
+                else:
+                    parts.append(re.escape(token))
+            alternatives.append(f"(?:{''.join(parts)})")
+        if not alternatives:
+            return re.compile(r"(?!)")  # Never matches
+        return re.compile("|".join(alternatives), re.IGNORECASE)
+
     @staticmethod
     def _cell_to_tuple(cell_ref: str) -> Tuple[str, int]:
         """Helper function to split cell reference into column letter and row number."""
-        col_str = "".join(filter(str.isalpha, cell_ref))
-        row_str = "".join(filter(str.isdigit, cell_ref))
+        match = _CELL_REF_PATTERN.fullmatch(cell_ref)
+        if match is None:
+            raise ValueError(f"Invalid cell reference: {cell_ref}")
+        col_str, row_str = match.groups()
         return col_str, int(row_str) if row_str else 0
 
+    @staticmethod
+    def _merge_runs(cols: Sequence[int], rows: Sequence[int]) -> List[Tuple[int, int]]:
+        """
+        Find runs of adjacent cells in one sheet's coordinates, sorted by column and row.
+
+        A run grows while each cell sits directly below or directly right of the
+        previous one. Works on integers only, so the inputs can be plain lists,
+        tuples or arrays.
+
+        Returns:
+            List of (start index, end index) pairs, both inclusive.
+        """
+        runs = []
+        start = 0
+        for i in range(1, len(cols)):
+            prev = i - 1
+            if (cols[i] == cols[prev] and rows[i] == rows[prev] + 1) or (
+                rows[i] == rows[prev] and cols[i] == cols[prev] + 1
+            ):
+                continue
+            runs.append((start, prev))
+            start = i
+        runs.append((start, len(cols) - 1))
+        return runs
+
     def compress_cell_references(self, references: List[Tuple[str, str]]) -> List[str]:
         """
         Compress a list of cell references (sheet, cell) into ranges where possible.
@@ -155,78 +580,25 @@ class SpreadsheetCompressor:
             return []
 
         try:
-            # Sort references by sheet, then by column and row
-            sorted_refs = sorted(
-                references,
-                key=lambda x: (
-                    x[0],  # sheet
-                    column_index_from_string(
-                        self._cell_to_tuple(x[1])[0]
-                    ),  # column number
-                    self._cell_to_tuple(x[1])[1],  # row number
-                ),
-            )
-
+            # Partition by sheet, parsing each reference once into (column number,
+            # row number, cell) records, so each sort only compares integers
+            by_sheet: Dict[str, List[Tuple[int, int, str]]] = defaultdict(list)
+            for sheet, cell in references:
+                col_str, row = self._cell_to_tuple(cell)
+                by_sheet[sheet].append((column_index_from_string(col_str), row, cell))
+
+            # Plain concatenation is cheaper than formatting for these short strings
             ranges = []
-            if not sorted_refs:
-                return ranges
-
-            current_range_start_sheet, current_range_start_cell = sorted_refs[0]
-            current_range_end_sheet, current_range_end_cell = sorted_refs[0]
-
-            def _format_range(start_sheet, start_cell, end_cell):
-                if start_cell == end_cell:
-                    return f"{start_sheet}!{start_cell}"
-                return f"{start_sheet}!{start_cell}:{end_cell}"
-
-            for i in range(1, len(sorted_refs)):
-                sheet, cell = sorted_refs[i]
-                start_col, start_row = self._cell_to_tuple(current_range_start_cell)
-                end_col, end_row = self._cell_to_tuple(current_range_end_cell)
-                current_col, current_row = self._cell_to_tuple(cell)
-
-                if sheet == current_range_start_sheet:
-                    if (current_col == end_col and current_row == end_row + 1) or (
-                        current_row == end_row
-                        and column_index_from_string(current_col)
-                        == column_index_from_string(end_col) + 1
-                    ):
-                        # Extend current range
-                        current_range_end_cell = cell
+            for sheet in sorted(by_sheet):
+                decorated = by_sheet[sheet]
+                decorated.sort()
+                cols, rows, cells = zip(*decorated)
+                prefix = sheet + "!"
+                for start, end in self._merge_runs(cols, rows):
+                    if start == end:
+                        ranges.append(prefix + cells[start])
                     else:
-                        # Flush current range
-                        ranges.append(
-                            _format_range(
-                                current_range_start_sheet,
-                                current_range_start_cell,
-                                current_range_end_cell,
-                            )
-                        )
-                        current_range_start_sheet, current_range_start_cell = (
-                            sheet,
-                            cell,
-                        )
-                        current_range_end_sheet, current_range_end_cell = sheet, cell
-                else:
-                    # Flush current range
-                    ranges.append(
-                        _format_range(
-                            current_range_start_sheet,
-                            current_range_start_cell,
-                            current_range_end_cell,
-                        )
-                    )
-                    current_range_start_sheet, current_range_start_cell = sheet, cell
-                    current_range_end_sheet, current_range_end_cell = sheet, cell
-
-            # Flush the last range
-            ranges.append(
-                _format_range(
-                    current_range_start_sheet,
-                    current_range_start_cell,
-                    current_range_end_cell,
-                )
-            )
+                        ranges.append(prefix + cells[start] + ":" + cells[end])
             return ranges
 
         except Exception as e:
@@ -234,60 +606,91 @@ class SpreadsheetCompressor:
             # Return uncompressed references as fallback
             return [f"{ref[0]}!{ref[1]}" for ref in references]
 
-    def _process_cells(
+    def _process_excel_rows(
+        self, ws: "openpyxl.worksheet._read_only.ReadOnlyWorksheet", sheet_name: str
+    ) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Process a read-only Excel worksheet and group its cells by their data type.
+
+        Args:
+            ws: The worksheet, from a workbook opened with ``read_only=True``.
+            sheet_name: Name of the current sheet.
+
+        Returns:
+            Dictionary mapping data types to uncompressed (sheet, cell) references.
+        """
+        # The dimensions stored in the file can be wrong, and make openpyxl pad every
+        # row to the full sheet width; without them each row stops at its last cell
+        ws.reset_dimensions()
+        return self._process_list_rows(ws.iter_rows(values_only=True), sheet_name)
+
+    def _process_list_rows(
         self,
-        cells: Union[
-            openpyxl.worksheet.worksheet.Worksheet.rows,
-            List[List[Union[str, int, float]]],
-        ],
+        rows: Iterable[Sequence[Union[str, int, float, None]]],
         sheet_name: str,
-    ) -> Dict[str, List[str]]:
+    ) -> Dict[str, List[Tuple[str, str]]]:
         """
-        Process cells from a sheet and group them by their data type.
+        Process rows of cell values from a sheet and group them by their data type.
 
         Args:
-            cells: Iterable of row objects (for Excel) or list of lists (for ODS/CSV).
+            rows: Iterable of row value sequences (e.g. csv.reader rows or ODS rows),
+                  with None for empty cells.
             sheet_name: Name of the current sheet.
 
         Returns:
-            Dictionary mapping data types to compressed cell references.
+            Dictionary mapping data types to uncompressed (sheet, cell) references;
+            callers compress them once all sheets have been merged.
         """
+        # Every reference of the sheet shares one interned name string
+        sheet_name = sys.intern(sheet_name)
         grouped_data: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
 
-        if isinstance(cells, openpyxl.worksheet.worksheet.Worksheet.rows):
-            for row in cells:
-                for cell in row:
-                    if cell.value is not None:
-                        dtype = self.recognize_data_type(cell.value)
-                        if dtype == "Others":
-                            grouped_data[str(cell.value)].append(
-                                [sheet_name, cell.coordinate]
-                            )
-                        elif dtype != "Empty":
-                            grouped_data[dtype].append([sheet_name, cell.coordinate])
-        elif isinstance(cells, list):
-            for row_idx, row in enumerate(cells, start=1):
-                for col_idx, cell_value in enumerate(row, start=1):
-                    if cell_value is not None:
-                        dtype = self.recognize_data_type(cell_value)
+        for row_idx, row in enumerate(rows, start=1):
+            for col_idx, cell_value in enumerate(row, start=1):
+                if cell_value is not None:
+                    dtype = self.recognize_data_type(cell_value)
+                    if col_idx < len(_COLUMN_LETTERS):
+                        col_letter = _COLUMN_LETTERS[col_idx]
+                    else:
                         col_letter = get_column_letter(col_idx)
-                        cell_ref = f"{col_letter}{row_idx}"
-                        if dtype == "Others":
-                            grouped_data[str(cell_value)].append([sheet_name, cell_ref])
-                        elif dtype != "Empty":
-                            grouped_data[dtype].append([sheet_name, cell_ref])
-
-        return {
-            key: self.compress_cell_references(references)
-            for key, references in grouped_data.items()
-        }
+                    cell_ref = f"{col_letter}{row_idx}"
+                    if dtype == "Others":
+                        grouped_data[str(cell_value)].append((sheet_name, cell_ref))
+                    elif dtype != "Empty":
+                        grouped_data[dtype].append((sheet_name, cell_ref))
+
+        return grouped_data
+
+    def _parse_excel_sheet(
+        self, data: bytes, sheet_name: str
+    ) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Open an Excel file and process a single sheet of it.
+
+        Used by parse_excel worker processes, since openpyxl worksheets cannot be
+        sent between processes.
 
-    def parse_excel(self, file: BytesIO) -> Dict[str, List[str]]:
+        Args:
+            data: The raw Excel file data.
+            sheet_name: Name of the sheet to process.
+
+        Returns:
+            Dictionary mapping data types to uncompressed (sheet, cell) references.
+        """
+        wb = openpyxl.load_workbook(BytesIO(data), read_only=True, data_only=True)
+        try:
+            return self._process_excel_rows(wb[sheet_name], sheet_name)
+        finally:
+            wb.close()
+
+    def parse_excel(self, file: BinaryIO, max_workers: int = 1) -> Dict[str, List[str]]:
         """
         Parse an Excel file and group cells by their data type.
 
         Args:
-            file: A BytesIO object containing the Excel file data.
+            file: A binary file object (e.g. BytesIO) containing the Excel file data.
+            max_workers: Number of worker processes used to parse sheets in parallel
+                         (default: 1, parse sheets sequentially in this process).
 
         Returns:
             A dictionary mapping data types to compressed cell references.
@@ -296,22 +699,49 @@ class SpreadsheetCompressor:
             SpreadsheetParsingError: If there is an error parsing the Excel file.
         """
         try:
-            wb = openpyxl.load_workbook(file)
-            result: Dict[str, List[str]] = {}
+            # Stream cell values instead of building the full workbook in memory
+            wb = openpyxl.load_workbook(file, read_only=True, data_only=True)
+            sheet_names = wb.sheetnames
+
+            if max_workers > 1 and len(sheet_names) > 1:
+                wb.close()
+                file.seek(0)
+                self.logger.debug(
+                    f"Processing {len(sheet_names)} sheets with up to {max_workers} workers"
+                )
+                # Each worker gets the file data and compressor settings once, up front
+                with ProcessPoolExecutor(
+                    max_workers=min(max_workers, len(sheet_names)),
+                    initializer=_init_excel_worker,
+                    initargs=(type(self), self._init_options, file.read()),
+                ) as executor:
+                    sheet_results = list(
+                        executor.map(_parse_excel_sheet_in_worker, sheet_names)
+                    )
+            else:
+                sheet_results = []
+                try:
+                    for sheet_name in sheet_names:
+                        self.logger.debug(f"Processing sheet: {sheet_name}")
+                        sheet_results.append(
+                            self._process_excel_rows(wb[sheet_name], sheet_name)
+                        )
+                finally:
+                    wb.close()  # Read-only workbooks keep the underlying archive open
 
-            for sheet_name in wb.sheetnames:
-                self.logger.debug(f"Processing sheet: {sheet_name}")
-                ws = wb[sheet_name]
-                sheet_data = self._process_cells(ws.rows, sheet_name)
+            grouped_data: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+            for sheet_data in sheet_results:
                 # Merge the sheet data with the overall result
                 for key, value in sheet_data.items():
-                    if key in result:
-                        result[key].extend(value)
-                    else:
-                        result[key] = value
+                    grouped_data[key].extend(value)
+
+            compressed_data = {
+                key: self.compress_cell_references(references)
+                for key, references in grouped_data.items()
+            }
 
             self.logger.info("Excel parsing completed successfully")
-            return result
+            return compressed_data
 
         except openpyxl.utils.exceptions.InvalidFileException as e:
             self.logger.error(f"Error: Invalid Excel file format - {e}")
@@ -320,12 +750,12 @@ class SpreadsheetCompressor:
             self.logger.error(f"Error parsing Excel file: {str(e)}")
             raise SpreadsheetParsingError(f"Error parsing Excel file: {e}")
 
-    def parse_ods(self, file: BytesIO) -> Dict[str, List[str]]:
+    def parse_ods(self, file: BinaryIO) -> Dict[str, List[str]]:
         """
         Parse an ODS file and group cells by their data type.
 
         Args:
-            file: A BytesIO object containing the ODS file data.
+            file: A binary file object (e.g. BytesIO) containing the ODS file data.
 
         Returns:
             A dictionary mapping data types to compressed cell references.
@@ -334,12 +764,16 @@ class SpreadsheetCompressor:
             SpreadsheetParsingError: If there is an error parsing the ODS file.
         """
         try:
-            data = pyexcel_ods.get_data(file)
             grouped_data: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
 
-            for sheet_name, sheet_data in data.items():
+            # Rows are streamed from content.xml and arrive grouped by sheet
+            for sheet_name, sheet_rows in groupby(
+                _iter_ods_rows(file), key=itemgetter(0)
+            ):
                 self.logger.debug(f"Processing sheet: {sheet_name}")
-                sheet_result = self._process_cells(sheet_data, sheet_name)
+                sheet_result = self._process_list_rows(
+                    (row for _, row in sheet_rows), sheet_name
+                )
                 for key, value in sheet_result.items():
                     grouped_data[key].extend(value)
 
@@ -356,13 +790,14 @@ class SpreadsheetCompressor:
             raise SpreadsheetParsingError(f"Error parsing ODS file: {e}")
 
     def parse_csv(
-        self, file: BytesIO, encoding: str = "utf-8", delimiter: str = ","
+        self, file: BinaryIO, encoding: str = "utf-8", delimiter: str = ","
     ) -> Dict[str, List[str]]:
         """
         Parse a CSV file and group cells by their data type.
 
         Args:
-            file: A BytesIO object containing the CSV file data.
+            file: A binary file object (e.g. BytesIO or a streamed response body)
+                  containing the CSV file data.
             encoding: The file encoding (default: utf-8).
             delimiter: The CSV delimiter (default: comma).
 
@@ -373,20 +808,20 @@ class SpreadsheetCompressor:
             SpreadsheetParsingError: If there is an error parsing the CSV file.
         """
         try:
-            grouped_data: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
-
-            text = file.getvalue().decode(encoding)
-            csv_data = StringIO(text)
-            reader = csv.reader(csv_data, delimiter=delimiter)
-
-            rows = list(reader)
-            sheet_result = self._process_cells(rows, "Sheet1")
-            for key, value in sheet_result.items():
-                grouped_data[key].extend(value)
+            # Decode and classify rows as they are read, without a decoded copy of the
+            # whole file or a list of every row
+            if file.seekable():
+                file.seek(0)
+            csv_data = TextIOWrapper(file, encoding=encoding, newline="")
+            try:
+                reader = csv.reader(csv_data, delimiter=delimiter)
+                sheet_result = self._process_list_rows(reader, "Sheet1")
+            finally:
+                csv_data.detach()  # Leave the caller's buffer open
 
             compressed_data = {
                 key: self.compress_cell_references(references)
-                for key, references in grouped_data.items()
+                for key, references in sheet_result.items()
             }
 
             self.logger.info("CSV parsing completed successfully")
@@ -402,40 +837,112 @@ class SpreadsheetCompressor:
         """
         Parse any supported spreadsheet file from a URL based on its extension.
 
+        Results are cached per URL and parser arguments when the server sends an ETag or
+        Last-Modified header; later calls send a conditional request and reuse the cached
+        result if the server answers 304 Not Modified.
+
         Args:
             file_url: The URL of the spreadsheet file.
             verify_ssl: Whether to verify the SSL certificate of the URL (default: True).
-            **kwargs: Additional keyword arguments to pass to the specific parser function (e.g., 'encoding' and 'delimiter' for CSV).
+            **kwargs: Additional keyword arguments to pass to the specific parser function ('encoding' and 'delimiter' for CSV,
+                      'max_workers' for Excel); they are ignored when parsing other file types.
 
         Returns:
             A dictionary mapping data types to compressed cell references.
 
         Raises:
             ValueError: If the file extension is not supported.
+            TypeError: If a keyword argument is not accepted by any parser.
             requests.exceptions.RequestException: If there is an issue downloading the file.
             SpreadsheetParsingError: If there is an error parsing the file content.
         """
         try:
-            self.logger.info(f"Downloading file from: {file_url}")
-            response = requests.get(file_url, verify=verify_ssl, stream=True)
-            response.raise_for_status()  # Raise an exception for bad status codes
-
-            file = BytesIO(response.content)
             file_path = Path(file_url)
             extension = file_path.suffix.lower()
-
-            self.logger.info(f"Parsing file with extension: {extension}")
-            if extension in (".xlsx", ".xlsm", ".xltx", ".xltm"):
-                return self.parse_excel(file)
-            elif extension == ".ods":
-                return self.parse_ods(file)
-            elif extension == ".csv":
-                return self.parse_csv(file, **kwargs)
-            else:
+            if extension not in self.SUPPORTED_EXTENSIONS:
                 raise ValueError(
                     f"Unsupported file extension: {extension}. Supported extensions are: {self.SUPPORTED_EXTENSIONS}"
                 )
 
+            # Route keyword arguments to the parser that takes them; the other parsers
+            # ignore them, but arguments no parser takes are still an error
+            csv_kwargs = {
+                name: kwargs.pop(name)
+                for name in ("encoding", "delimiter")
+                if name in kwargs
+            }
+            excel_kwargs = {
+                name: kwargs.pop(name) for name in ("max_workers",) if name in kwargs
+            }
+            if kwargs:
+                raise TypeError(
+                    f"parse_file() got unexpected keyword arguments: {', '.join(kwargs)}"
+                )
+            if extension == ".csv":
+                kwargs = csv_kwargs
+            elif extension != ".ods":
+                kwargs = excel_kwargs
+
+            cache_key = (file_url, tuple(sorted(kwargs.items())))
+            cached = self._parse_cache.get(cache_key)
+            headers = {}
+            if cached is not None:
+                validators, _ = cached
+                if "ETag" in validators:
+                    headers["If-None-Match"] = validators["ETag"]
+                if "Last-Modified" in validators:
+                    headers["If-Modified-Since"] = validators["Last-Modified"]
+
+            self.logger.info(f"Downloading file from: {file_url}")
+            with requests.get(
+                file_url, verify=verify_ssl, stream=True, headers=headers
+            ) as response:
+                response.raise_for_status()  # Raise an exception for bad status codes
+
+                if cached is not None and response.status_code == 304:
+                    self.logger.info("File not modified, using cached result")
+                    self._parse_cache.move_to_end(cache_key)
+                    return {key: list(value) for key, value in cached[1].items()}
+
+                self.logger.info(f"Parsing file with extension: {extension}")
+                if extension == ".csv":
+                    # Parse CSV rows straight off the connection, undoing any gzip/deflate;
+                    # auto_close must be off for the stream to be wrapped by TextIOWrapper
+                    response.raw.decode_content = True
+                    response.raw.auto_close = False
+                    result = self.parse_csv(response.raw, **kwargs)
+                else:
+                    # Excel and ODS files are zip archives that need random access, so
+                    # spool the download to disk rather than holding it in memory
+                    with tempfile.TemporaryFile() as file:
+                        for chunk in response.iter_content(
+                            chunk_size=self.DOWNLOAD_CHUNK_SIZE
+                        ):
+                            file.write(chunk)
+                        file.seek(0)
+
+                        if extension == ".ods":
+                            result = self.parse_ods(file)
+                        else:
+                            result = self.parse_excel(file, **kwargs)
+
+                validators = {
+                    header: response.headers[header]
+                    for header in ("ETag", "Last-Modified")
+                    if header in response.headers
+                }
+                if validators:
+                    self._parse_cache[cache_key] = (
+                        validators,
+                        {key: list(value) for key, value in result.items()},
+                    )
+                    self._parse_cache.move_to_end(cache_key)
+                    if len(self._parse_cache) > self.PARSE_CACHE_MAX_SIZE:
+                        self._parse_cache.popitem(last=False)
+                else:
+                    self._parse_cache.pop(cache_key, None)
+                return result
+
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Error downloading file from {file_url}: {e}")
             raise